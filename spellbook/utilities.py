@@ -1,9 +1,25 @@
+import glob
+import os
 import pathlib
 
 def get_file_paths(path: str, file_type: str='.csv') -> list:
     """
     Returns a list of all .file_type files in the specified folder path.
+    file_type may contain glob wildcards (e.g. '.xls*'), in which case the folder is matched with Path.glob.
+    Returns an empty list if the folder does not exist or cannot be read.
+
+    For a plain extension the folder is scanned with os.scandir, which differs from Path.glob in that
+    only regular files are returned: directories and broken symlinks whose names end in file_type are skipped.
     """
     folder_path = pathlib.Path(path)
-    file_paths = [str(file_path) for file_path in folder_path.glob(f'*{file_type}')]
+    if glob.has_magic(file_type):
+        return [str(file_path) for file_path in folder_path.glob(f'*{file_type}')]
+
+    suffix = os.path.normcase(file_type)  # Case-insensitive on Windows, like Path.glob
+    try:
+        with os.scandir(folder_path) as entries:
+            file_paths = [str(folder_path / entry.name) for entry in entries
+                          if os.path.normcase(entry.name).endswith(suffix) and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return []
     return file_paths
\ No newline at end of file
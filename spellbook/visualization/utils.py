@@ -1,16 +1,49 @@
-import matplotlib.pyplot as plt
-import nltk
-from wordcloud import WordCloud
-from pythainlp.tokenize import Tokenizer as th_tokenizer  # Requires PyThaiNLP for Thai tokenization
-from nltk.tokenize import word_tokenize as en_tokenizer  # For English tokenization
-from nltk.corpus import stopwords
-from pythainlp.corpus import thai_stopwords
-from pathlib import Path
-
-# Download NLTK data for English tokenization (if not already installed)
-nltk.download('punkt')
-nltk.download('punkt_tab')
-nltk.download('stopwords')
+from functools import lru_cache
+
+# NLTK and PyThaiNLP are imported on first use to keep module import cheap.
+# NLTK data required for English tokenization: download package name -> resource path
+_NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+}
+_NLTK_ATTEMPTED = set()  # Packages already found or downloaded (successfully or not) in this process
+
+def _ensure_nltk(*packages: str):
+    """
+    Downloads the given NLTK packages on first use (if not already installed).
+    Each package is checked at most once per process, so a failed download (e.g. offline) is not retried on every call.
+    """
+    packages = [package for package in packages if package not in _NLTK_ATTEMPTED]
+    if not packages:
+        return
+    import nltk
+    for package in packages:
+        _NLTK_ATTEMPTED.add(package)
+        try:
+            nltk.data.find(_NLTK_RESOURCES[package])
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+@lru_cache(maxsize=4)
+def _get_th_tokenizer(engine: str):
+    """
+    Returns a cached PyThaiNLP tokenizer for the given engine (building one loads its dictionary).
+    """
+    from pythainlp.tokenize import Tokenizer as th_tokenizer  # Requires PyThaiNLP for Thai tokenization
+    return th_tokenizer(custom_dict=None, engine=engine)
+
+@lru_cache(maxsize=None)
+def _get_stopwords(language: str) -> frozenset:
+    """
+    Returns the cached stopword set for the given language ('th' or 'en').
+    """
+    if language == 'th':
+        from pythainlp.corpus import thai_stopwords
+        return frozenset(thai_stopwords())
+    _ensure_nltk('stopwords')
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words('english'))
 
 def tokenize_text(text: str, language: str = 'th', keep_stopwords: bool = True, keep_spaces: bool = False, engine: str = 'newmm') -> list:
     """
@@ -31,25 +64,23 @@ def tokenize_text(text: str, language: str = 'th', keep_stopwords: bool = True,
     """
     # Tokenize the text based on the specified language
     if language == 'th':
-        _tokenizer = th_tokenizer(custom_dict=None, engine=engine)
-        words = _tokenizer.word_tokenize(text)  # Tokenize Thai text
+        words = _get_th_tokenizer(engine).word_tokenize(text)  # Tokenize Thai text
     elif language == 'en':
+        _ensure_nltk('punkt', 'punkt_tab')
+        from nltk.tokenize import word_tokenize as en_tokenizer  # For English tokenization
         words = en_tokenizer(text)  # Tokenize English text using NLTK
     else:
         raise ValueError("Language must be 'th' for Thai or 'en' for English.")
     
-    # Stopwords handling
-    if language == 'th':
-        stop_words = thai_stopwords()
-    else:
-        stop_words = set(stopwords.words('english'))
-
-    # Remove stopwords if keep_stopwords is False
+    # Remove stopwords and/or space characters in a single pass
     if not keep_stopwords:
-        words = [word for word in words if word.lower() not in stop_words]
-
-    # Remove space characters if keep_spaces is False
-    if not keep_spaces:
+        stop_words = _get_stopwords(language)
+        if language == 'th':
+            # Thai has no letter case, so tokens can be looked up as-is
+            words = [word for word in words if (keep_spaces or word.strip() != '') and word not in stop_words]
+        else:
+            words = [word for word in words if (keep_spaces or word.strip() != '') and word.lower() not in stop_words]
+    elif not keep_spaces:
         words = [word for word in words if word.strip() != '']
 
     return words
\ No newline at end of file
@@ -1,21 +1,11 @@
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud
+import re
 from pathlib import Path
-from spellbook.visualization import utils
-#import nltk
-#from pythainlp.tokenize import Tokenizer as th_tokenizer  # Requires PyThaiNLP for Thai tokenization
-#from nltk.tokenize import word_tokenize as en_tokenizer  # For English tokenization
-#from nltk.corpus import stopwords
-#from pythainlp.corpus import thai_stopwords
-
-# Download NLTK data for English tokenization (if not already installed)
-#nltk.download('punkt')
-#nltk.download('punkt_tab')
-#nltk.download('stopwords')
+from .utils import tokenize_text
 
 FONT_FOLDER = Path(__file__).parent / 'fonts'
+WORD_PATTERN = re.compile(r"[\u0E00-\u0E7Fa-zA-Z']+")  # Match Thai or English words
 
-def plot_wordcloud(text: str, language: str = 'th', keep_stopwords: bool = True, font_path: str = FONT_FOLDER / 'THSarabunNew.ttf', engine: str = 'newmm', figsize=(10, 6), interpolation="bilinear", title: str = None, width: int = 800, height: int = 400, save_path: str = None, transparent=True, **wordcloud_kwargs):
+def plot_wordcloud(text: str, language: str = 'th', keep_stopwords: bool = True, font_path: str = None, engine: str = 'newmm', figsize=(10, 6), interpolation="bilinear", title: str = None, width: int = 800, height: int = 400, save_path: str = None, transparent=True, **wordcloud_kwargs):
     """
     Plots a word cloud from text with language-specific tokenization and stopword handling.
 
@@ -23,7 +13,7 @@ def plot_wordcloud(text: str, language: str = 'th', keep_stopwords: bool = True,
     text (str): The input text.
     language (str): The language of the text ('th' for Thai, 'en' for English).
     keep_stopwords (bool): Whether to keep or drop stopwords. True keeps stopwords, False drops them.
-    font_path (str): Path to a Thai font file (default: TH Sarabun New).
+    font_path (str): Path to a Thai font file (default: None, which means the bundled TH Sarabun New).
     engine (str): The tokenizer engine for Thai text ('newmm', 'longest', 'lucene').
     figsize (tuple): Figure size for the plot (default: (10, 6)).
     interpolation (str): Interpolation method for displaying the image (default: "bilinear").
@@ -33,27 +23,15 @@ def plot_wordcloud(text: str, language: str = 'th', keep_stopwords: bool = True,
     save_path (str): Path to save the word cloud image (default: None, which means the image is not saved).
     wordcloud_kwargs: Additional keyword arguments to customize the WordCloud instance (e.g., max_words, contour_color).
     """
-    #print(FONT_FOLDER)
-    # Tokenize the text based on the specified language
-    '''if language == 'th':
-        _tokenizer = th_tokenizer(custom_dict=None, engine=engine)
-        words = _tokenizer.word_tokenize(text)  # Tokenize Thai text
-    elif language == 'en':
-        words = en_tokenizer(text)  # Tokenize English text using NLTK
-    else:
-        raise ValueError("Language must be 'th' for Thai or 'en' for English.")
-    
-    # Stopwords handling
-    if language == 'th':
-        stop_words = thai_stopwords()
-    else:
-        stop_words = set(stopwords.words('english'))
+    # matplotlib and wordcloud are imported here so importing spellbook.visualization stays cheap
+    import matplotlib.pyplot as plt
+    from wordcloud import WordCloud
 
-    # Remove stopwords if keep_stopwords is False
-    if not keep_stopwords:
-        words = [word for word in words if word.lower() not in stop_words]'''
-    
-    words = utils.tokenize_text(text, language=language, keep_stopwords=keep_stopwords, engine=engine)
+    if font_path is None:
+        font_path = FONT_FOLDER / 'THSarabunNew.ttf'
+
+    # Tokenize the text and drop stopwords with the shared tokenizer
+    words = tokenize_text(text, language=language, keep_stopwords=keep_stopwords, engine=engine)
 
     processed_text = " ".join(words)  # Join words for wordcloud input
 
@@ -67,7 +45,7 @@ def plot_wordcloud(text: str, language: str = 'th', keep_stopwords: bool = True,
         collocations=False,
         normalize_plurals=True,
         include_numbers=False,
-        regexp=r"[\u0E00-\u0E7Fa-zA-Z']+",  # Match Thai or English words
+        regexp=WORD_PATTERN,
         #colormap="viridis",
         **wordcloud_kwargs  # Pass additional parameters to WordCloud
     ).generate(processed_text)